@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import abc
+import os
+import types
 import typing as t
-from pathlib import Path
+from functools import wraps
 
-from dbt.adapters.base import BaseRelation, Column
 from pydantic import Field
 
 from sqlmesh.core.console import get_console
@@ -36,22 +37,71 @@ from sqlmesh.utils import AttributeDict, classproperty
 from sqlmesh.utils.errors import ConfigError
 from sqlmesh.utils.pydantic import field_validator, model_validator
 
+if t.TYPE_CHECKING:
+    from dbt.adapters.base import BaseRelation, Column
+
+_DBT_GE_1_5 = DBT_VERSION >= (1, 5, 0)
+_DBT_LT_1_6 = DBT_VERSION < (1, 6, 0)
+_DBT_GE_1_8 = DBT_VERSION >= (1, 8, 0)
+
 IncrementalKind = t.Union[
     t.Type[IncrementalByUniqueKeyKind],
     t.Type[IncrementalByTimeRangeKind],
     t.Type[IncrementalUnmanagedKind],
 ]
 
-# We only serialize a subset of fields in order to avoid persisting sensitive information
+# The default incremental strategy for each target type, keyed by (type, kind). A kind of None is
+# the fallback for kinds without an entry of their own.
+_INCREMENTAL_STRATEGY: t.Dict[t.Tuple[str, t.Optional[IncrementalKind]], str] = {
+    ("duckdb", None): "delete+insert",
+    ("snowflake", None): "merge",
+    ("postgres", IncrementalByUniqueKeyKind): "delete+insert",
+    ("postgres", None): "append",
+    ("redshift", None): "append",
+    ("databricks", None): "merge",
+    ("bigquery", None): "merge",
+    # https://github.com/microsoft/dbt-fabric/blob/main/dbt/include/fabric/macros/materializations/models/incremental/incremental_strategies.sql
+    ("sqlserver", IncrementalByUniqueKeyKind): "delete+insert",
+    ("sqlserver", None): "append",
+    ("trino", None): "append",
+    # dbt-clickhouse name for temp table swap. That is sqlmesh's default
+    #   strategy so doesn't require special handling during conversion.
+    ("clickhouse", None): "legacy",
+    ("athena", None): "insert_overwrite",
+}
+
+# We only serialize a subset of fields in order to avoid persisting sensitive information.
+# Maps each serialized key to the attribute it's read from.
 SERIALIZABLE_FIELDS = {
-    "type",
-    "name",
-    "database",
-    "schema_",
+    "type": "type",
+    "name": "name",
+    "database": "database",
+    "schema": "schema_",
 }
 
 
-class TargetConfig(abc.ABC, DbtConfig):
+def _coalesce(data: t.Dict[str, t.Any], field: str, *aliases: str, error: str) -> None:
+    """Sets `field` to the first truthy value among it and its aliases, or raises `error`."""
+    data[field] = data.get(field) or next((data[a] for a in aliases if data.get(a)), None)
+    if not data[field]:
+        raise ConfigError(error)
+
+
+def _dict_only_before_validator(
+    func: t.Callable[[t.Any, t.Dict[str, t.Any]], t.Dict[str, t.Any]],
+) -> t.Any:
+    """Registers `func` as a before-mode model validator that only runs when the input is a dict."""
+
+    @wraps(func)
+    def wrapper(cls: t.Any, data: t.Any) -> t.Any:
+        if not isinstance(data, dict):
+            return data
+        return func(cls, data)
+
+    return model_validator(mode="before")(classmethod(wrapper))
+
+
+class TargetConfig(abc.ABC, DbtConfig, frozen=True):
     """
     Configuration for DBT profile target
 
@@ -71,6 +121,9 @@ class TargetConfig(abc.ABC, DbtConfig):
     threads: int = 1
     profile_name: t.Optional[str] = None
 
+    # Maps target fields to the SQLMesh connection config arguments they're passed as
+    _TO_SQLMESH_MAP: t.ClassVar[t.Dict[str, str]] = {}
+
     @classmethod
     def load(cls, data: t.Dict[str, t.Any]) -> TargetConfig:
         """
@@ -90,7 +143,12 @@ class TargetConfig(abc.ABC, DbtConfig):
 
     def default_incremental_strategy(self, kind: IncrementalKind) -> str:
         """The default incremental strategy for the db"""
-        raise NotImplementedError
+        strategy = _INCREMENTAL_STRATEGY.get((self.type, kind)) or _INCREMENTAL_STRATEGY.get(
+            (self.type, None)
+        )
+        if strategy is None:
+            raise NotImplementedError
+        return strategy
 
     def to_sqlmesh(self, **kwargs: t.Any) -> ConnectionConfig:
         """Converts target config to SQLMesh connection config"""
@@ -100,25 +158,38 @@ class TargetConfig(abc.ABC, DbtConfig):
     def from_sqlmesh(cls, config: ConnectionConfig, **kwargs: t.Dict[str, t.Any]) -> "TargetConfig":
         raise NotImplementedError
 
+    def _connection_kwargs(self) -> t.Dict[str, t.Any]:
+        """The SQLMesh connection config arguments declared in _TO_SQLMESH_MAP"""
+        fields = self.__dict__
+        return {dst: fields[src] for src, dst in self._TO_SQLMESH_MAP.items()}
+
     def attribute_dict(self) -> AttributeDict:
-        fields = self.dict(include=SERIALIZABLE_FIELDS).copy()
+        fields = {}
+        for key, attr in SERIALIZABLE_FIELDS.items():
+            value = getattr(self, attr)
+            if value is not None:
+                fields[key] = value
         fields["target_name"] = self.name
         return AttributeDict(fields)
 
-    @classproperty
+    @classproperty(cached=True)
     def quote_policy(cls) -> Policy:
         return Policy()
 
     @property
     def extra(self) -> t.Set[str]:
-        return self.extra_fields(set(self.dict()))
+        return {k for k, v in (self.model_extra or {}).items() if v is not None}
 
-    @classproperty
+    @classproperty(cached=True)
     def relation_class(cls) -> t.Type[BaseRelation]:
+        from dbt.adapters.base import BaseRelation
+
         return BaseRelation
 
-    @classproperty
+    @classproperty(cached=True)
     def column_class(cls) -> t.Type[Column]:
+        from dbt.adapters.base import Column
+
         return Column
 
     @property
@@ -148,28 +219,21 @@ class DuckDbConfig(TargetConfig):
     settings: t.Optional[t.Dict[str, t.Any]] = None
     secrets: t.Optional[t.List[t.Dict[str, t.Any]]] = None
 
-    @model_validator(mode="before")
-    def validate_authentication(cls, data: t.Any) -> t.Any:
-        if not isinstance(data, dict):
-            return data
-
-        if "database" not in data and DBT_VERSION >= (1, 5, 0):
+    @_dict_only_before_validator
+    def validate_authentication(cls, data: t.Dict[str, t.Any]) -> t.Dict[str, t.Any]:
+        if "database" not in data and _DBT_GE_1_5:
             path = data.get("path")
-            data["database"] = (
-                "memory"
-                if path is None or path == DUCKDB_IN_MEMORY
-                else Path(t.cast(str, path)).stem
-            )
+            if path is None or path == DUCKDB_IN_MEMORY:
+                data["database"] = "memory"
+            else:
+                data["database"] = os.path.splitext(os.path.basename(t.cast(str, path)))[0]
 
         if "threads" in data and t.cast(int, data["threads"]) > 1:
             get_console().log_warning("DuckDB does not support concurrency - setting threads to 1.")
 
         return data
 
-    def default_incremental_strategy(self, kind: IncrementalKind) -> str:
-        return "delete+insert"
-
-    @classproperty
+    @classproperty(cached=True)
     def relation_class(cls) -> t.Type[BaseRelation]:
         from dbt.adapters.duckdb.relation import DuckDBRelation
 
@@ -201,6 +265,9 @@ class DuckDbConfig(TargetConfig):
         )
 
 
+_SNOWFLAKE_AUTH_KEYS = ("password", "authenticator", "private_key", "private_key_path")
+
+
 class SnowflakeConfig(TargetConfig):
     """
     Project connection and operational configuration for the Snowflake target
@@ -254,52 +321,45 @@ class SnowflakeConfig(TargetConfig):
     retry_on_database_errors: bool = False
     retry_all: bool = False
 
-    @model_validator(mode="before")
-    @classmethod
-    def validate_authentication(cls, data: t.Any) -> t.Any:
-        if not isinstance(data, dict) or (
-            data.get("password")
-            or data.get("authenticator")
-            or data.get("private_key")
-            or data.get("private_key_path")
-        ):
-            return data
+    _TO_SQLMESH_MAP = {
+        "user": "user",
+        "password": "password",
+        "authenticator": "authenticator",
+        "account": "account",
+        "warehouse": "warehouse",
+        "database": "database",
+        "role": "role",
+        "threads": "concurrent_tasks",
+        "token": "token",
+        "private_key": "private_key",
+        "private_key_path": "private_key_path",
+        "private_key_passphrase": "private_key_passphrase",
+    }
 
-        raise ConfigError("No supported Snowflake authentication method found in target profile.")
+    @_dict_only_before_validator
+    def validate_authentication(cls, data: t.Dict[str, t.Any]) -> t.Dict[str, t.Any]:
+        for key in _SNOWFLAKE_AUTH_KEYS:
+            if data.get(key):
+                return data
 
-    def default_incremental_strategy(self, kind: IncrementalKind) -> str:
-        return "merge"
+        raise ConfigError("No supported Snowflake authentication method found in target profile.")
 
-    @classproperty
+    @classproperty(cached=True)
     def relation_class(cls) -> t.Type[BaseRelation]:
         from dbt.adapters.snowflake import SnowflakeRelation
 
         return SnowflakeRelation
 
-    @classproperty
+    @classproperty(cached=True)
     def column_class(cls) -> t.Type[Column]:
         from dbt.adapters.snowflake import SnowflakeColumn
 
         return SnowflakeColumn
 
     def to_sqlmesh(self, **kwargs: t.Any) -> ConnectionConfig:
-        return SnowflakeConnectionConfig(
-            user=self.user,
-            password=self.password,
-            authenticator=self.authenticator,
-            account=self.account,
-            warehouse=self.warehouse,
-            database=self.database,
-            role=self.role,
-            concurrent_tasks=self.threads,
-            token=self.token,
-            private_key=self.private_key,
-            private_key_path=self.private_key_path,
-            private_key_passphrase=self.private_key_passphrase,
-            **kwargs,
-        )
+        return SnowflakeConnectionConfig(**self._connection_kwargs(), **kwargs)
 
-    @classproperty
+    @classproperty(cached=True)
     def quote_policy(cls) -> Policy:
         return Policy(database=False, schema=False, identifier=False)
 
@@ -335,40 +395,27 @@ class PostgresConfig(TargetConfig):
     role: t.Optional[str] = None
     sslmode: t.Optional[str] = None
 
-    @model_validator(mode="before")
-    @classmethod
-    def validate_database(cls, data: t.Any) -> t.Any:
-        if not isinstance(data, dict):
-            return data
+    _TO_SQLMESH_MAP = {
+        "host": "host",
+        "user": "user",
+        "password": "password",
+        "port": "port",
+        "dbname": "database",
+        "keepalives_idle": "keepalives_idle",
+        "threads": "concurrent_tasks",
+        "connect_timeout": "connect_timeout",
+        "role": "role",
+        "sslmode": "sslmode",
+    }
 
-        data["database"] = data.get("database") or data.get("dbname")
-        if not data["database"]:
-            raise ConfigError("Either database or dbname must be set")
+    @_dict_only_before_validator
+    def validate_database(cls, data: t.Dict[str, t.Any]) -> t.Dict[str, t.Any]:
+        _coalesce(data, "database", "dbname", error="Either database or dbname must be set")
 
         return data
 
-    @field_validator("port")
-    @classmethod
-    def _validate_port(cls, v: t.Union[int, str]) -> int:
-        return int(v)
-
-    def default_incremental_strategy(self, kind: IncrementalKind) -> str:
-        return "delete+insert" if kind is IncrementalByUniqueKeyKind else "append"
-
     def to_sqlmesh(self, **kwargs: t.Any) -> ConnectionConfig:
-        return PostgresConnectionConfig(
-            host=self.host,
-            user=self.user,
-            password=self.password,
-            port=self.port,
-            database=self.dbname,
-            keepalives_idle=self.keepalives_idle,
-            concurrent_tasks=self.threads,
-            connect_timeout=self.connect_timeout,
-            role=self.role,
-            sslmode=self.sslmode,
-            **kwargs,
-        )
+        return PostgresConnectionConfig(**self._connection_kwargs(), **kwargs)
 
     @classmethod
     def from_sqlmesh(
@@ -421,47 +468,39 @@ class RedshiftConfig(TargetConfig):
     search_path: t.Optional[str] = None
     sslmode: t.Optional[str] = None
 
-    @model_validator(mode="before")
-    @classmethod
-    def validate_database(cls, data: t.Any) -> t.Any:
-        if not isinstance(data, dict):
-            return data
+    _TO_SQLMESH_MAP = {
+        "user": "user",
+        "password": "password",
+        "database": "database",
+        "host": "host",
+        "port": "port",
+        "sslmode": "sslmode",
+        "connect_timeout": "timeout",
+        "threads": "concurrent_tasks",
+    }
 
-        data["database"] = data.get("database") or data.get("dbname")
-        if not data["database"]:
-            raise ConfigError("Either database or dbname must be set")
+    @_dict_only_before_validator
+    def validate_database(cls, data: t.Dict[str, t.Any]) -> t.Dict[str, t.Any]:
+        _coalesce(data, "database", "dbname", error="Either database or dbname must be set")
 
         return data
 
-    def default_incremental_strategy(self, kind: IncrementalKind) -> str:
-        return "append"
-
-    @classproperty
+    @classproperty(cached=True)
     def relation_class(cls) -> t.Type[BaseRelation]:
         from dbt.adapters.redshift import RedshiftRelation
 
         return RedshiftRelation
 
-    @classproperty
+    @classproperty(cached=True)
     def column_class(cls) -> t.Type[Column]:
-        if DBT_VERSION < (1, 6, 0):
+        if _DBT_LT_1_6:
             from dbt.adapters.redshift import RedshiftColumn  # type: ignore
 
             return RedshiftColumn
         return super(RedshiftConfig, cls).column_class
 
     def to_sqlmesh(self, **kwargs: t.Any) -> ConnectionConfig:
-        return RedshiftConnectionConfig(
-            user=self.user,
-            password=self.password,
-            database=self.database,
-            host=self.host,
-            port=self.port,
-            sslmode=self.sslmode,
-            timeout=self.connect_timeout,
-            concurrent_tasks=self.threads,
-            **kwargs,
-        )
+        return RedshiftConnectionConfig(**self._connection_kwargs(), **kwargs)
 
 
 class DatabricksConfig(TargetConfig):
@@ -485,16 +524,23 @@ class DatabricksConfig(TargetConfig):
     client_id: t.Optional[str] = None
     client_secret: t.Optional[str] = None
 
-    def default_incremental_strategy(self, kind: IncrementalKind) -> str:
-        return "merge"
+    _TO_SQLMESH_MAP = {
+        "host": "server_hostname",
+        "http_path": "http_path",
+        "token": "access_token",
+        "threads": "concurrent_tasks",
+        "database": "catalog",
+        "client_id": "oauth_client_id",
+        "client_secret": "oauth_client_secret",
+    }
 
-    @classproperty
+    @classproperty(cached=True)
     def relation_class(cls) -> t.Type[BaseRelation]:
         from dbt.adapters.databricks.relation import DatabricksRelation
 
         return DatabricksRelation
 
-    @classproperty
+    @classproperty(cached=True)
     def column_class(cls) -> t.Type[Column]:
         from dbt.adapters.databricks.column import DatabricksColumn
 
@@ -502,18 +548,19 @@ class DatabricksConfig(TargetConfig):
 
     def to_sqlmesh(self, **kwargs: t.Any) -> ConnectionConfig:
         return DatabricksConnectionConfig(
-            server_hostname=self.host,
-            http_path=self.http_path,
-            access_token=self.token,
-            concurrent_tasks=self.threads,
-            catalog=self.database,
+            **self._connection_kwargs(),
             auth_type="databricks-oauth" if self.auth_type == "oauth" else self.auth_type,
-            oauth_client_id=self.client_id,
-            oauth_client_secret=self.client_secret,
             **kwargs,
         )
 
 
+_DEFAULT_BQ_SCOPES: t.Tuple[str, ...] = (
+    "https://www.googleapis.com/auth/bigquery",
+    "https://www.googleapis.com/auth/cloud-platform",
+    "https://www.googleapis.com/auth/drive",
+)
+
+
 class BigQueryConfig(TargetConfig):
     """
     Project connection and operational configuration for the BigQuery target
@@ -556,11 +603,7 @@ class BigQueryConfig(TargetConfig):
     client_id: t.Optional[str] = None
     client_secret: t.Optional[str] = None
     token_uri: t.Optional[str] = None
-    scopes: t.Tuple[str, ...] = (
-        "https://www.googleapis.com/auth/bigquery",
-        "https://www.googleapis.com/auth/cloud-platform",
-        "https://www.googleapis.com/auth/drive",
-    )
+    scopes: t.Tuple[str, ...] = _DEFAULT_BQ_SCOPES
     impersonated_service_account: t.Optional[str] = None
     job_creation_timeout_seconds: t.Optional[int] = None
     job_execution_timeout_seconds: t.Optional[int] = None
@@ -571,31 +614,42 @@ class BigQueryConfig(TargetConfig):
     priority: BigQueryPriority = BigQueryPriority.INTERACTIVE
     maximum_bytes_billed: t.Optional[int] = None
 
-    @model_validator(mode="before")
-    @classmethod
-    def validate_fields(cls, data: t.Any) -> t.Any:
-        if not isinstance(data, dict):
-            return data
+    _TO_SQLMESH_MAP = {
+        "method": "method",
+        "database": "project",
+        "execution_project": "execution_project",
+        "quota_project": "quota_project",
+        "location": "location",
+        "threads": "concurrent_tasks",
+        "keyfile": "keyfile",
+        "keyfile_json": "keyfile_json",
+        "token": "token",
+        "refresh_token": "refresh_token",
+        "client_id": "client_id",
+        "client_secret": "client_secret",
+        "token_uri": "token_uri",
+        "scopes": "scopes",
+        "impersonated_service_account": "impersonated_service_account",
+        "job_creation_timeout_seconds": "job_creation_timeout_seconds",
+        "job_retry_deadline_seconds": "job_retry_deadline_seconds",
+        "priority": "priority",
+        "maximum_bytes_billed": "maximum_bytes_billed",
+    }
 
-        data["schema"] = data.get("schema") or data.get("dataset")
-        if not data["schema"]:
-            raise ConfigError("Either schema or dataset must be set")
-        data["database"] = data.get("database") or data.get("project")
-        if not data["database"]:
-            raise ConfigError("Either database or project must be set")
+    @_dict_only_before_validator
+    def validate_fields(cls, data: t.Dict[str, t.Any]) -> t.Dict[str, t.Any]:
+        _coalesce(data, "schema", "dataset", error="Either schema or dataset must be set")
+        _coalesce(data, "database", "project", error="Either database or project must be set")
 
         return data
 
-    def default_incremental_strategy(self, kind: IncrementalKind) -> str:
-        return "merge"
-
-    @classproperty
+    @classproperty(cached=True)
     def relation_class(cls) -> t.Type[BaseRelation]:
         from dbt.adapters.bigquery.relation import BigQueryRelation
 
         return BigQueryRelation
 
-    @classproperty
+    @classproperty(cached=True)
     def column_class(cls) -> t.Type[Column]:
         from dbt.adapters.bigquery import BigQueryColumn
 
@@ -609,27 +663,9 @@ class BigQueryConfig(TargetConfig):
             else self.timeout_seconds
         )
         return BigQueryConnectionConfig(
-            method=self.method,
-            project=self.database,
-            execution_project=self.execution_project,
-            quota_project=self.quota_project,
-            location=self.location,
-            concurrent_tasks=self.threads,
-            keyfile=self.keyfile,
-            keyfile_json=self.keyfile_json,
-            token=self.token,
-            refresh_token=self.refresh_token,
-            client_id=self.client_id,
-            client_secret=self.client_secret,
-            token_uri=self.token_uri,
-            scopes=self.scopes,
-            impersonated_service_account=self.impersonated_service_account,
-            job_creation_timeout_seconds=self.job_creation_timeout_seconds,
+            **self._connection_kwargs(),
             job_execution_timeout_seconds=job_execution_timeout_seconds,
             job_retries=job_retries,
-            job_retry_deadline_seconds=self.job_retry_deadline_seconds,
-            priority=self.priority,
-            maximum_bytes_billed=self.maximum_bytes_billed,
             **kwargs,
         )
 
@@ -723,23 +759,24 @@ class MSSQLConfig(TargetConfig):
     client_id: t.Optional[str] = None  # Azure Active Directory auth
     client_secret: t.Optional[str] = None  # Azure Active Directory auth
 
-    @model_validator(mode="before")
-    @classmethod
-    def validate_alias_fields(cls, data: t.Any) -> t.Any:
-        if not isinstance(data, dict):
-            return data
-
-        data["host"] = data.get("host") or data.get("server")
-        if not data["host"]:
-            raise ConfigError("Either host or server must be set")
-
-        data["user"] = data.get("user") or data.get("username") or data.get("UID")
-        if not data["user"]:
-            raise ConfigError("One of user, username, or UID must be set")
+    _TO_SQLMESH_MAP = {
+        "host": "host",
+        "user": "user",
+        "password": "password",
+        "port": "port",
+        "database": "database",
+        "query_timeout": "timeout",
+        "login_timeout": "login_timeout",
+        "threads": "concurrent_tasks",
+    }
 
-        data["password"] = data.get("password") or data.get("PWD")
-        if not data["password"]:
-            raise ConfigError("Either password or PWD must be set")
+    @_dict_only_before_validator
+    def validate_alias_fields(cls, data: t.Dict[str, t.Any]) -> t.Dict[str, t.Any]:
+        _coalesce(data, "host", "server", error="Either host or server must be set")
+        _coalesce(
+            data, "user", "username", "UID", error="One of user, username, or UID must be set"
+        )
+        _coalesce(data, "password", "PWD", error="Either password or PWD must be set")
 
         return data
 
@@ -750,22 +787,11 @@ class MSSQLConfig(TargetConfig):
             raise ConfigError("Only SQL and Windows Authentication are supported for SQL Server")
         return v
 
-    @field_validator("port")
-    @classmethod
-    def _validate_port(cls, v: t.Union[int, str]) -> int:
-        return int(v)
-
-    def default_incremental_strategy(self, kind: IncrementalKind) -> str:
-        # https://github.com/microsoft/dbt-fabric/blob/main/dbt/include/fabric/macros/materializations/models/incremental/incremental_strategies.sql
-        return "delete+insert" if kind is IncrementalByUniqueKeyKind else "append"
-
-    @classproperty
+    @classproperty(cached=True)
     def column_class(cls) -> t.Type[Column]:
-        try:
-            # 1.8.0+
+        if _DBT_GE_1_8:
             from dbt.adapters.sqlserver.sqlserver_column import SQLServerColumn
-        except ImportError:
-            # <1.8.0
+        else:
             from dbt.adapters.sqlserver.sql_server_column import SQLServerColumn  # type: ignore
 
         return SQLServerColumn
@@ -775,17 +801,20 @@ class MSSQLConfig(TargetConfig):
         return "tsql"
 
     def to_sqlmesh(self, **kwargs: t.Any) -> ConnectionConfig:
-        return MSSQLConnectionConfig(
-            host=self.host,
-            user=self.user,
-            password=self.password,
-            port=self.port,
-            database=self.database,
-            timeout=self.query_timeout,
-            login_timeout=self.login_timeout,
-            concurrent_tasks=self.threads,
-            **kwargs,
-        )
+        return MSSQLConnectionConfig(**self._connection_kwargs(), **kwargs)
+
+
+_TRINO_METHOD_MAP: t.Mapping[str, TrinoAuthenticationMethod] = types.MappingProxyType(
+    {
+        "none": TrinoAuthenticationMethod.NO_AUTH,
+        "ldap": TrinoAuthenticationMethod.LDAP,
+        "kerberos": TrinoAuthenticationMethod.KERBEROS,
+        "jwt": TrinoAuthenticationMethod.JWT,
+        "certificate": TrinoAuthenticationMethod.CERTIFICATE,
+        "oauth": TrinoAuthenticationMethod.OAUTH,
+        "oauth_console": TrinoAuthenticationMethod.OAUTH,
+    }
+)
 
 
 class TrinoConfig(TargetConfig):
@@ -823,16 +852,6 @@ class TrinoConfig(TargetConfig):
         cert: Certification authentication: Full path to a certificate file
     """
 
-    _method_to_auth_enum: t.ClassVar[t.Dict[str, TrinoAuthenticationMethod]] = {
-        "none": TrinoAuthenticationMethod.NO_AUTH,
-        "ldap": TrinoAuthenticationMethod.LDAP,
-        "kerberos": TrinoAuthenticationMethod.KERBEROS,
-        "jwt": TrinoAuthenticationMethod.JWT,
-        "certificate": TrinoAuthenticationMethod.CERTIFICATE,
-        "oauth": TrinoAuthenticationMethod.OAUTH,
-        "oauth_console": TrinoAuthenticationMethod.OAUTH,
-    }
-
     type: t.Literal["trino"] = "trino"
     host: str
     database: str
@@ -873,16 +892,49 @@ class TrinoConfig(TargetConfig):
     client_private_key: t.Optional[str] = None
     cert: t.Optional[str] = None
 
-    def default_incremental_strategy(self, kind: IncrementalKind) -> str:
-        return "append"
+    _TO_SQLMESH_MAP = {
+        "host": "host",
+        "user": "user",
+        "database": "catalog",
+        "port": "port",
+        "http_scheme": "http_scheme",
+        "roles": "roles",
+        "http_headers": "http_headers",
+        "session_properties": "session_properties",
+        "retries": "retries",
+        "timezone": "timezone",
+        "password": "password",
+        "impersonation_user": "impersonation_user",
+        "keytab": "keytab",
+        "krb5_config": "krb5_config",
+        "principal": "principal",
+        "service_name": "service_name",
+        "hostname_override": "hostname_override",
+        "mutual_authentication": "mutual_authentication",
+        "force_preemptive": "force_preemptive",
+        "sanitize_mutual_error_response": "sanitize_mutual_error_response",
+        "delegate": "delegate",
+        "jwt_token": "jwt_token",
+        "client_certificate": "client_certificate",
+        "client_private_key": "client_private_key",
+        "cert": "cert",
+        "threads": "concurrent_tasks",
+    }
 
-    @classproperty
+    @field_validator("method")
+    @classmethod
+    def _validate_method(cls, v: str) -> str:
+        if v.lower() not in _TRINO_METHOD_MAP:
+            raise ConfigError(f"Unsupported Trino authentication method '{v}'.")
+        return v
+
+    @classproperty(cached=True)
     def relation_class(cls) -> t.Type[BaseRelation]:
         from dbt.adapters.trino.relation import TrinoRelation
 
         return TrinoRelation
 
-    @classproperty
+    @classproperty(cached=True)
     def column_class(cls) -> t.Type[Column]:
         from dbt.adapters.trino.column import TrinoColumn
 
@@ -890,33 +942,8 @@ class TrinoConfig(TargetConfig):
 
     def to_sqlmesh(self, **kwargs: t.Any) -> ConnectionConfig:
         return TrinoConnectionConfig(
-            method=self._method_to_auth_enum[self.method],
-            host=self.host,
-            user=self.user,
-            catalog=self.database,
-            port=self.port,
-            http_scheme=self.http_scheme,
-            roles=self.roles,
-            http_headers=self.http_headers,
-            session_properties=self.session_properties,
-            retries=self.retries,
-            timezone=self.timezone,
-            password=self.password,
-            impersonation_user=self.impersonation_user,
-            keytab=self.keytab,
-            krb5_config=self.krb5_config,
-            principal=self.principal,
-            service_name=self.service_name,
-            hostname_override=self.hostname_override,
-            mutual_authentication=self.mutual_authentication,
-            force_preemptive=self.force_preemptive,
-            sanitize_mutual_error_response=self.sanitize_mutual_error_response,
-            delegate=self.delegate,
-            jwt_token=self.jwt_token,
-            client_certificate=self.client_certificate,
-            client_private_key=self.client_private_key,
-            cert=self.cert,
-            concurrent_tasks=self.threads,
+            method=_TRINO_METHOD_MAP[self.method.lower()],
+            **self._connection_kwargs(),
             **kwargs,
         )
 
@@ -981,37 +1008,33 @@ class ClickhouseConfig(TargetConfig):
 
     type: t.Literal["clickhouse"] = "clickhouse"
 
-    def default_incremental_strategy(self, kind: IncrementalKind) -> str:
-        # dbt-clickhouse name for temp table swap. That is sqlmesh's default
-        #   strategy so doesn't require special handling during conversion.
-        return "legacy"
+    _TO_SQLMESH_MAP = {
+        "host": "host",
+        "user": "username",
+        "password": "password",
+        "port": "port",
+        "cluster": "cluster",
+        "connect_timeout": "connect_timeout",
+        "send_receive_timeout": "send_receive_timeout",
+        "verify": "verify",
+        "compression": "compression_method",
+        "custom_settings": "connection_settings",
+    }
 
-    @classproperty
+    @classproperty(cached=True)
     def relation_class(cls) -> t.Type[BaseRelation]:
         from dbt.adapters.clickhouse.relation import ClickHouseRelation
 
         return ClickHouseRelation
 
-    @classproperty
+    @classproperty(cached=True)
     def column_class(cls) -> t.Type[Column]:
         from dbt.adapters.clickhouse.column import ClickHouseColumn
 
         return ClickHouseColumn
 
     def to_sqlmesh(self, **kwargs: t.Any) -> ConnectionConfig:
-        return ClickhouseConnectionConfig(
-            host=self.host,
-            username=self.user,
-            password=self.password,
-            port=self.port,
-            cluster=self.cluster,
-            connect_timeout=self.connect_timeout,
-            send_receive_timeout=self.send_receive_timeout,
-            verify=self.verify,
-            compression_method=self.compression,
-            connection_settings=self.custom_settings,
-            **kwargs,
-        )
+        return ClickhouseConnectionConfig(**self._connection_kwargs(), **kwargs)
 
 
 class AthenaConfig(TargetConfig):
@@ -1066,47 +1089,46 @@ class AthenaConfig(TargetConfig):
     seed_s3_upload_args: t.Dict[str, str] = {}
     lf_tags_database: t.Dict[str, str] = {}
 
-    @classproperty
+    _TO_SQLMESH_MAP = {
+        "aws_access_key_id": "aws_access_key_id",
+        "aws_secret_access_key": "aws_secret_access_key",
+        "region_name": "region_name",
+        "work_group": "work_group",
+        "s3_staging_dir": "s3_staging_dir",
+        "s3_data_dir": "s3_warehouse_location",
+        "schema_": "schema_name",
+        "database": "catalog_name",
+        "threads": "concurrent_tasks",
+    }
+
+    @classproperty(cached=True)
     def relation_class(cls) -> t.Type[BaseRelation]:
         from dbt.adapters.athena.relation import AthenaRelation
 
         return AthenaRelation
 
-    @classproperty
+    @classproperty(cached=True)
     def column_class(cls) -> t.Type[Column]:
         from dbt.adapters.athena.column import AthenaColumn
 
         return AthenaColumn
 
-    def default_incremental_strategy(self, kind: IncrementalKind) -> str:
-        return "insert_overwrite"
-
     def to_sqlmesh(self, **kwargs: t.Any) -> ConnectionConfig:
-        return AthenaConnectionConfig(
-            type="athena",
-            aws_access_key_id=self.aws_access_key_id,
-            aws_secret_access_key=self.aws_secret_access_key,
-            region_name=self.region_name,
-            work_group=self.work_group,
-            s3_staging_dir=self.s3_staging_dir,
-            s3_warehouse_location=self.s3_data_dir,
-            schema_name=self.schema_,
-            catalog_name=self.database,
-            concurrent_tasks=self.threads,
-            **kwargs,
-        )
-
-
-TARGET_TYPE_TO_CONFIG_CLASS: t.Dict[str, t.Type[TargetConfig]] = {
-    "databricks": DatabricksConfig,
-    "duckdb": DuckDbConfig,
-    "postgres": PostgresConfig,
-    "redshift": RedshiftConfig,
-    "snowflake": SnowflakeConfig,
-    "bigquery": BigQueryConfig,
-    "sqlserver": MSSQLConfig,
-    "tsql": MSSQLConfig,
-    "trino": TrinoConfig,
-    "athena": AthenaConfig,
-    "clickhouse": ClickhouseConfig,
-}
+        return AthenaConnectionConfig(type="athena", **self._connection_kwargs(), **kwargs)
+
+
+TARGET_TYPE_TO_CONFIG_CLASS: t.Mapping[str, t.Type[TargetConfig]] = types.MappingProxyType(
+    {
+        "databricks": DatabricksConfig,
+        "duckdb": DuckDbConfig,
+        "postgres": PostgresConfig,
+        "redshift": RedshiftConfig,
+        "snowflake": SnowflakeConfig,
+        "bigquery": BigQueryConfig,
+        "sqlserver": MSSQLConfig,
+        "tsql": MSSQLConfig,
+        "trino": TrinoConfig,
+        "athena": AthenaConfig,
+        "clickhouse": ClickhouseConfig,
+    }
+)
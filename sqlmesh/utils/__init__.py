@@ -245,11 +245,37 @@ def ttl_cache(ttl: int = 60, maxsize: int = 128000) -> t.Callable:
 
 class classproperty(property):
     """
-    Similar to a normal property but works for class methods
+    Similar to a normal property but works for class methods.
+
+    If `cached` is set, e.g. `@classproperty(cached=True)`, the value is computed once per
+    owner class and returned from the cache on subsequent accesses.
     """
 
+    def __init__(
+        self,
+        fget: t.Optional[t.Callable[[t.Any], t.Any]] = None,
+        fset: t.Optional[t.Callable[[t.Any, t.Any], None]] = None,
+        fdel: t.Optional[t.Callable[[t.Any], None]] = None,
+        doc: t.Optional[str] = None,
+        *,
+        cached: bool = False,
+    ) -> None:
+        super().__init__(fget, fset, fdel, doc)
+        self.cached = cached
+        self._cache: t.Dict[t.Any, t.Any] = {}
+
+    def __call__(self, fget: t.Callable[[t.Any], t.Any]) -> classproperty:
+        return type(self)(fget, cached=self.cached)
+
     def __get__(self, obj: t.Any, owner: t.Any = None) -> t.Any:
-        return classmethod(self.fget).__get__(None, owner)()  # type: ignore
+        if owner is None:
+            owner = type(obj)
+        if not self.cached:
+            return classmethod(self.fget).__get__(None, owner)()  # type: ignore
+
+        if owner not in self._cache:
+            self._cache[owner] = classmethod(self.fget).__get__(None, owner)()  # type: ignore
+        return self._cache[owner]
 
 
 @contextmanager
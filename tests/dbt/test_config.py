@@ -5,8 +5,10 @@ from shutil import copytree
 
 import pytest
 from dbt.adapters.base import BaseRelation, Column
+from pydantic import ValidationError
 from pytest_mock import MockerFixture
 from sqlmesh.core.config import Config, ModelDefaultsConfig
+from sqlmesh.core.config.connection import TrinoAuthenticationMethod
 from sqlmesh.core.dialect import jinja_query
 from sqlmesh.core.model import SqlModel
 from sqlmesh.core.model.kind import OnDestructiveChange
@@ -513,6 +515,16 @@ def test_duckdb_threads(tmp_path):
     assert config.gateways["in_memory"].connection.concurrent_tasks == 1
 
 
+def test_duckdb_database_from_path():
+    assert DuckDbConfig(name="dev", schema="sushi").database == "memory"
+    assert DuckDbConfig(name="dev", schema="sushi", path=":memory:").database == "memory"
+    assert DuckDbConfig(name="dev", schema="sushi", path="data/local.duckdb").database == "local"
+    assert (
+        DuckDbConfig(name="dev", schema="sushi", path="local.db", database="other").database
+        == "other"
+    )
+
+
 def test_snowflake_config():
     config = _test_warehouse_config(
         """
@@ -540,6 +552,13 @@ def test_snowflake_config():
     assert sqlmesh_config.application == "Tobiko_SQLMesh"
 
 
+def test_snowflake_config_no_authentication():
+    with pytest.raises(ConfigError, match="No supported Snowflake authentication method"):
+        SnowflakeConfig(
+            name="dev", schema="sushi", database="sushi", account="account", user="user"
+        )
+
+
 def test_snowflake_config_private_key_path():
     config = _test_warehouse_config(
         """
@@ -833,8 +852,34 @@ def test_trino_config():
     )
 
 
+def test_trino_config_auth_method():
+    fields = {
+        "name": "dev",
+        "host": "localhost",
+        "database": "db",
+        "schema": "dbt_schema",
+        "user": "user",
+        "http_scheme": "https",
+    }
+
+    connection = TrinoConfig(**fields, method="LDAP", password="password").to_sqlmesh(
+        check_import=False
+    )
+    assert connection.method == TrinoAuthenticationMethod.LDAP
+
+    connection = TrinoConfig(**fields, method="oauth_console").to_sqlmesh(check_import=False)
+    assert connection.method == TrinoAuthenticationMethod.OAUTH
+
+    target = TrinoConfig(**fields, method="none")
+    connection = target.model_copy(update={"method": "oauth"}).to_sqlmesh(check_import=False)
+    assert connection.method == TrinoAuthenticationMethod.OAUTH
+
+    with pytest.raises(ConfigError, match="Unsupported Trino authentication method 'unknown'"):
+        TrinoConfig(**fields, method="unknown")
+
+
 def test_athena_config():
-    _test_warehouse_config(
+    config = _test_warehouse_config(
         """
         dbt-athena:
           target: dev
@@ -861,9 +906,18 @@ def test_athena_config():
         "dev",
     )
 
+    connection = config.to_sqlmesh(check_import=False)
+    assert connection.s3_staging_dir == "s3://athena-query-results/dbt/"
+    assert connection.s3_warehouse_location == "s3://your_s3_bucket/dbt/"
+    assert connection.schema_name == "dbt"
+    assert connection.catalog_name == "awsdatacatalog"
+    assert connection.region_name == "eu-west-1"
+    assert connection.work_group == "my-workgroup"
+    assert connection.concurrent_tasks == 4
+
 
 def test_clickhouse_config():
-    _test_warehouse_config(
+    config = _test_warehouse_config(
         """
         dbt-clickhouse:
           target: dev
@@ -890,6 +944,18 @@ def test_clickhouse_config():
         "dev",
     )
 
+    connection = config.to_sqlmesh(check_import=False)
+    assert connection.host == "thehost"
+    assert connection.username == "theuser"
+    assert connection.password == "thepassword"
+    assert connection.port == 1234
+    assert connection.cluster == "thecluster"
+    assert connection.connect_timeout == 1
+    assert connection.send_receive_timeout == 2
+    assert not connection.verify
+    assert connection.compression_method == "lz4"
+    assert connection.connection_settings == {"setting": "value"}
+
 
 def test_connection_args(tmp_path):
     dbt_project_dir = "tests/fixtures/dbt/sushi_test"
@@ -960,6 +1026,168 @@ def test_db_type_to_column_class():
     assert (TARGET_TYPE_TO_CONFIG_CLASS["athena"].column_class) == AthenaColumn
 
 
+def test_target_attribute_dict():
+    target = DuckDbConfig(name="dev", schema="sushi", password="secret")
+    assert target.attribute_dict() == {
+        "type": "duckdb",
+        "name": "dev",
+        "database": "memory",
+        "schema": "sushi",
+        "target_name": "dev",
+    }
+
+    target = DatabricksConfig(
+        name="dev", schema="sushi", host="localhost", http_path="/sql/1.0", catalog=None
+    )
+    assert target.attribute_dict() == {
+        "type": "databricks",
+        "name": "dev",
+        "schema": "sushi",
+        "target_name": "dev",
+    }
+
+
+def test_target_extra():
+    target = DuckDbConfig(name="dev", schema="sushi")
+    assert target.extra == set()
+
+    target = DuckDbConfig(
+        name="dev", schema="sushi", threads=1, unsupported="value", unset=None, schema_="other"
+    )
+    assert target.extra == {"unsupported", "schema_"}
+
+
+def _postgres_target(**kwargs: t.Any) -> PostgresConfig:
+    return PostgresConfig(
+        **{
+            "name": "dev",
+            "schema": "public",
+            "host": "localhost",
+            "user": "user",
+            "password": "password",
+            "port": 5432,
+            "dbname": "db",
+            **kwargs,
+        }
+    )
+
+
+def test_target_port_from_string():
+    assert _postgres_target(port="5432").port == 5432
+
+    mssql = MSSQLConfig(name="dev", host="localhost", user="user", password="password", port="1434")
+    assert mssql.port == 1434
+
+
+def test_target_to_sqlmesh_field_mapping():
+    connection = _postgres_target(threads=3, connect_timeout=5).to_sqlmesh(pre_ping=False)
+    assert connection.database == "db"
+    assert connection.concurrent_tasks == 3
+    assert connection.connect_timeout == 5
+    assert not connection.pre_ping
+
+    redshift = RedshiftConfig(
+        name="dev",
+        schema="public",
+        host="localhost",
+        user="user",
+        password="password",
+        port=5439,
+        dbname="db",
+        connect_timeout=7,
+    )
+    connection = redshift.to_sqlmesh()
+    assert connection.database == "db"
+    assert connection.timeout == 7
+    assert connection.concurrent_tasks == 1
+
+    bigquery = BigQueryConfig(
+        name="dev",
+        dataset="sushi",
+        project="project",
+        location="US",
+        threads=2,
+        timeout_seconds=60,
+        retries=5,
+    )
+    connection = bigquery.to_sqlmesh(check_import=False)
+    assert connection.project == "project"
+    assert connection.location == "US"
+    assert connection.concurrent_tasks == 2
+    assert connection.job_execution_timeout_seconds == 60
+    assert connection.job_retries == 5
+
+    bigquery = BigQueryConfig(
+        name="dev",
+        dataset="sushi",
+        project="project",
+        timeout_seconds=60,
+        job_execution_timeout_seconds=30,
+        retries=5,
+        job_retries=2,
+    )
+    connection = bigquery.to_sqlmesh(check_import=False)
+    assert connection.job_execution_timeout_seconds == 30
+    assert connection.job_retries == 2
+
+    mssql = MSSQLConfig(
+        name="dev",
+        host="localhost",
+        user="user",
+        password="password",
+        database="db",
+        threads=2,
+        query_timeout=30,
+        login_timeout=10,
+    )
+    connection = mssql.to_sqlmesh(check_import=False)
+    assert connection.database == "db"
+    assert connection.timeout == 30
+    assert connection.login_timeout == 10
+    assert connection.concurrent_tasks == 2
+
+    trino = TrinoConfig(
+        name="dev",
+        host="localhost",
+        database="catalog",
+        schema="dbt_schema",
+        method="ldap",
+        user="user",
+        password="password",
+        http_scheme="https",
+        threads=2,
+    )
+    connection = trino.to_sqlmesh(check_import=False)
+    assert connection.catalog == "catalog"
+    assert connection.port == 443
+    assert connection.concurrent_tasks == 2
+
+
+def test_target_is_frozen():
+    target = DuckDbConfig(name="dev", schema="sushi")
+    with pytest.raises(ValidationError, match="Instance is frozen"):
+        target.threads = 4
+
+
+def test_default_incremental_strategy():
+    duckdb = DuckDbConfig(name="dev", schema="sushi")
+    assert duckdb.default_incremental_strategy(IncrementalByUniqueKeyKind) == "delete+insert"
+    assert duckdb.default_incremental_strategy(IncrementalByTimeRangeKind) == "delete+insert"
+
+    postgres = _postgres_target()
+    assert postgres.default_incremental_strategy(IncrementalByUniqueKeyKind) == "delete+insert"
+    assert postgres.default_incremental_strategy(IncrementalByTimeRangeKind) == "append"
+
+    mssql = MSSQLConfig(name="dev", host="localhost", user="user", password="password")
+    assert mssql.default_incremental_strategy(IncrementalByUniqueKeyKind) == "delete+insert"
+    assert mssql.default_incremental_strategy(IncrementalByTimeRangeKind) == "append"
+
+
+def test_target_type_to_config_class_is_read_only():
+    with pytest.raises(TypeError):
+        TARGET_TYPE_TO_CONFIG_CLASS["duckdb"] = PostgresConfig  # type: ignore
+
+
 def test_db_type_to_quote_policy():
     assert isinstance(TARGET_TYPE_TO_CONFIG_CLASS["duckdb"].quote_policy, Policy)
 
@@ -5,7 +5,7 @@ from sqlglot.optimizer.annotate_types import annotate_types
 
 from sqlmesh.core.console import set_console, get_console, TerminalConsole
 
-from sqlmesh.utils import columns_to_types_all_known
+from sqlmesh.utils import classproperty, columns_to_types_all_known
 
 
 @pytest.mark.parametrize(
@@ -77,6 +77,38 @@ def test_columns_to_types_all_known(columns_to_types, expected) -> None:
     assert columns_to_types_all_known(columns_to_types) == expected
 
 
+def test_classproperty_cached() -> None:
+    calls = []
+
+    class Base:
+        @classproperty
+        def uncached(cls) -> str:
+            calls.append(("uncached", cls))
+            return cls.__name__
+
+        @classproperty(cached=True)
+        def cached(cls) -> str:
+            calls.append(("cached", cls))
+            return cls.__name__
+
+    class Child(Base):
+        pass
+
+    assert Base.uncached == "Base"
+    assert Base.uncached == "Base"
+    assert Base.cached == "Base"
+    assert Base.cached == "Base"
+    assert Base().cached == "Base"
+    assert Child.cached == "Child"
+    assert Child().cached == "Child"
+    assert calls == [
+        ("uncached", Base),
+        ("uncached", Base),
+        ("cached", Base),
+        ("cached", Child),
+    ]
+
+
 def use_terminal_console(func):
     @wraps(func)
     def test_wrapper(*args, **kwargs):